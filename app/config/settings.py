@@ -9,6 +9,13 @@ class Config:
     SLACK_WEBHOOK_URL = os.getenv("SLACK_WEBHOOK_URL")
     CRON_SCHEDULE_MODE = os.getenv("CRON_SCHEDULE_MODE", "random")
     SLACK_NOTIFY_EVERY_MINUTE = os.getenv("SLACK_NOTIFY_EVERY_MINUTE", "False").lower() == "true"
+    SHUTDOWN_TIMEOUT = float(os.getenv("SHUTDOWN_TIMEOUT", "30"))
+
+    CLIENT_TRIGGERS_PER_MINUTE = float(os.getenv("CLIENT_TRIGGERS_PER_MINUTE", "30"))
+    CLIENT_TRIGGER_BURST = int(os.getenv("CLIENT_TRIGGER_BURST", "5"))
+    TASK_TRIGGERS_PER_MINUTE = float(os.getenv("TASK_TRIGGERS_PER_MINUTE", "60"))
+    TASK_TRIGGER_BURST = int(os.getenv("TASK_TRIGGER_BURST", "10"))
+    MAX_IN_FLIGHT_RUNS = int(os.getenv("MAX_IN_FLIGHT_RUNS", "8"))
 
     LOG_MAX_BYTES = 10 * 1024 * 1024
     LOG_BACKUP_COUNT = 5
@@ -0,0 +1,37 @@
+from fastapi import HTTPException
+from typing import Optional
+from app.services.stats_service import StatsService
+from app.utils.logger import setup_logger
+
+
+logger = setup_logger(__name__)
+
+
+class StatsController:
+    """Controller for handling run statistics requests."""
+
+    def __init__(self, stats_service: StatsService):
+        """
+        Initialize stats controller.
+
+        Args:
+            stats_service: Service holding run statistics rollups
+        """
+        self.stats_service = stats_service
+
+    def get_stats(self, task_name: Optional[str], window: str) -> dict:
+        """
+        Get run statistics for a task over a trailing window.
+
+        Args:
+            task_name: Task to summarize, or None for all tasks
+            window: Window name (minute, hour, day, week, month)
+
+        Returns:
+            Aggregated run statistics
+        """
+        try:
+            return self.stats_service.get_stats(task_name, window)
+        except ValueError as e:
+            logger.warning(f"Invalid stats request: {e}")
+            raise HTTPException(status_code=400, detail=str(e))
@@ -1,6 +1,7 @@
 from fastapi import HTTPException
 from app.models.task import Task
-from app.services.task_service import TaskService
+from app.services.admission_service import AdmissionError, AdmissionService
+from app.services.task_service import ShuttingDownError, TaskService
 from app.utils.logger import setup_logger
 
 
@@ -10,29 +11,43 @@ logger = setup_logger(__name__)
 class TaskController:
     """Controller for handling task-related requests."""
 
-    def __init__(self, task_service: TaskService):
+    def __init__(self, task_service: TaskService, admission_service: AdmissionService):
         """
         Initialize task controller.
 
         Args:
             task_service: Service for task execution
+            admission_service: Service limiting manual triggers
         """
         self.task_service = task_service
+        self.admission_service = admission_service
 
-    def run_task(self, task_name: str) -> dict:
+    def run_task(self, task_name: str, client_id: str) -> dict:
         """
         Execute a task manually.
 
         Args:
             task_name: Name of the task to execute
+            client_id: Identifier of the calling client
 
         Returns:
             Task execution result
         """
-        logger.info(f"Manual task trigger requested: {task_name}")
+        logger.info(f"Manual task trigger requested: {task_name} (client: {client_id})")
 
         task = Task(name=task_name)
-        executed_task = self.task_service.execute_task(task)
+        try:
+            executed_task = self.admission_service.run_task(client_id, task)
+        except AdmissionError as e:
+            logger.warning(f"Manual task trigger throttled: {task_name} (client: {client_id}): {e}")
+            raise HTTPException(
+                status_code=e.status_code,
+                detail=str(e),
+                headers={"Retry-After": str(e.retry_after)}
+            )
+        except ShuttingDownError as e:
+            logger.warning(f"Manual task trigger rejected: {task_name}: {e}")
+            raise HTTPException(status_code=503, detail=str(e))
 
         return {
             "message": f"Task '{task_name}' executed",
@@ -0,0 +1,157 @@
+import sqlite3
+from dataclasses import dataclass, field
+from typing import List, Optional
+from app.config.settings import Config
+from app.utils.quantile_sketch import QuantileSketch
+import os
+
+
+@dataclass
+class RunRollup:
+    """Aggregated run statistics for one task over one time bucket."""
+
+    task_name: str
+    granularity: str  # minute, hour, day
+    bucket_start: int  # unix timestamp of bucket start
+    runs: int = 0
+    successes: int = 0
+    failures: int = 0
+    total_duration: float = 0.0
+    sketch: QuantileSketch = field(default_factory=QuantileSketch)
+
+    def add(self, succeeded: bool, duration: float) -> None:
+        """Record a single finished run in this bucket."""
+        self.runs += 1
+        if succeeded:
+            self.successes += 1
+        else:
+            self.failures += 1
+        self.total_duration += duration
+        self.sketch.add(duration)
+
+    def merge(self, other: "RunRollup") -> None:
+        """Fold another rollup's counters and sketch into this one."""
+        self.runs += other.runs
+        self.successes += other.successes
+        self.failures += other.failures
+        self.total_duration += other.total_duration
+        self.sketch.merge(other.sketch)
+
+    def to_row(self) -> tuple:
+        """Snapshot the rollup as a run_stats table row."""
+        return (self.task_name, self.granularity, self.bucket_start, self.runs, self.successes,
+                self.failures, self.total_duration, self.sketch.to_json())
+
+
+class RunStatsDatabase:
+    """SQLite database persisting per-task run rollup buckets."""
+
+    def __init__(self, db_path: Optional[str] = None):
+        """
+        Initialize run statistics database.
+
+        Args:
+            db_path: Path to SQLite database file
+        """
+        if db_path is None:
+            db_path = os.path.join(Config.LOG_DIR, "run_stats.db")
+
+        self.db_path = db_path
+        self._create_table()
+
+    def _create_table(self) -> None:
+        """Create run_stats table if it doesn't exist."""
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS run_stats (
+                task TEXT NOT NULL,
+                granularity TEXT NOT NULL,
+                bucket_start INTEGER NOT NULL,
+                runs INTEGER DEFAULT 0,
+                successes INTEGER DEFAULT 0,
+                failures INTEGER DEFAULT 0,
+                total_duration REAL DEFAULT 0,
+                sketch TEXT NOT NULL,
+                PRIMARY KEY(task, granularity, bucket_start)
+            )
+        ''')
+
+        conn.commit()
+        conn.close()
+
+    def save_rollups(self, rows: List[tuple]) -> None:
+        """
+        Insert or replace rollup buckets.
+
+        Args:
+            rows: Rollup snapshots from RunRollup.to_row
+        """
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+
+        cursor.executemany('''
+            INSERT OR REPLACE INTO run_stats
+                (task, granularity, bucket_start, runs, successes, failures, total_duration, sketch)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ''', rows)
+
+        conn.commit()
+        conn.close()
+
+    def load_rollups(self, granularity: str, since: int) -> List[RunRollup]:
+        """
+        Load rollup buckets of a granularity starting at or after a timestamp.
+
+        Args:
+            granularity: Bucket granularity (minute, hour, day)
+            since: Earliest bucket start to load
+
+        Returns:
+            List of stored rollups
+        """
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+
+        cursor.execute('''
+            SELECT task, bucket_start, runs, successes, failures, total_duration, sketch
+            FROM run_stats
+            WHERE granularity = ? AND bucket_start >= ?
+        ''', (granularity, since))
+        rows = cursor.fetchall()
+
+        conn.close()
+
+        return [
+            RunRollup(
+                task_name=task,
+                granularity=granularity,
+                bucket_start=bucket_start,
+                runs=runs,
+                successes=successes,
+                failures=failures,
+                total_duration=total_duration,
+                sketch=QuantileSketch.from_json(sketch)
+            )
+            for task, bucket_start, runs, successes, failures, total_duration, sketch in rows
+        ]
+
+    def delete_before(self, granularity: str, before: int) -> None:
+        """
+        Remove rollup buckets older than a timestamp.
+
+        Args:
+            granularity: Bucket granularity (minute, hour, day)
+            before: Bucket starts strictly older than this are deleted
+        """
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+
+        cursor.execute(
+            'DELETE FROM run_stats WHERE granularity = ? AND bucket_start < ?',
+            (granularity, before)
+        )
+
+        conn.commit()
+        conn.close()
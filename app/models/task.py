@@ -10,7 +10,7 @@ class Task:
     name: str
     start_time: Optional[datetime] = None
     end_time: Optional[datetime] = None
-    status: str = "pending"  # pending, running, completed, failed
+    status: str = "pending"  # pending, running, completed, failed, interrupted
     log_file_path: Optional[str] = None
     error_message: Optional[str] = None
 
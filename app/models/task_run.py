@@ -0,0 +1,104 @@
+import sqlite3
+from datetime import datetime
+from typing import List, Optional
+from app.config.settings import Config
+from app.models.task import Task
+import os
+
+
+class TaskRunDatabase:
+    """SQLite journal of task runs that have started but not yet finished."""
+
+    def __init__(self, db_path: Optional[str] = None):
+        """
+        Initialize task run journal.
+
+        Args:
+            db_path: Path to SQLite database file
+        """
+        if db_path is None:
+            db_path = os.path.join(Config.LOG_DIR, "task_runs.db")
+
+        self.db_path = db_path
+        self._create_table()
+
+    def _create_table(self) -> None:
+        """Create task_runs table if it doesn't exist."""
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS task_runs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL,
+                start_time TEXT NOT NULL,
+                log_file_path TEXT
+            )
+        ''')
+
+        conn.commit()
+        conn.close()
+
+    def add_run(self, task: Task) -> int:
+        """
+        Journal a task run as in flight.
+
+        Args:
+            task: Running task
+
+        Returns:
+            Journal id of the run
+        """
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+
+        cursor.execute(
+            'INSERT INTO task_runs (name, start_time, log_file_path) VALUES (?, ?, ?)',
+            (task.name, task.start_time.isoformat(), task.log_file_path)
+        )
+        run_id = cursor.lastrowid
+
+        conn.commit()
+        conn.close()
+
+        return run_id
+
+    def remove_run(self, run_id: int) -> None:
+        """
+        Remove a finished run from the journal.
+
+        Args:
+            run_id: Journal id returned by add_run
+        """
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+
+        cursor.execute('DELETE FROM task_runs WHERE id = ?', (run_id,))
+
+        conn.commit()
+        conn.close()
+
+    def get_runs(self) -> List[tuple]:
+        """
+        Get all journaled runs.
+
+        Returns:
+            List of (run_id, task) tuples for runs that never finished
+        """
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+
+        cursor.execute('SELECT id, name, start_time, log_file_path FROM task_runs ORDER BY id')
+        rows = cursor.fetchall()
+
+        conn.close()
+
+        return [
+            (run_id, Task(
+                name=name,
+                start_time=datetime.fromisoformat(start_time),
+                status="interrupted",
+                log_file_path=log_file_path
+            ))
+            for run_id, name, start_time, log_file_path in rows
+        ]
@@ -0,0 +1,230 @@
+import math
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Optional
+from app.utils.logger import setup_logger
+from app.models.task import Task
+from app.services.stats_service import StatsService
+from app.services.task_service import AtCapacityError, TaskAlreadyRunningError, TaskService
+
+
+logger = setup_logger(__name__)
+
+# Idle buckets are pruned once this many keys are tracked
+MAX_TRACKED_BUCKETS = 10000
+
+# Retry hint (seconds) when no recent run durations are available
+DEFAULT_RETRY_AFTER = 1
+
+
+class AdmissionError(Exception):
+    """Raised when a trigger is rejected by admission control."""
+
+    def __init__(self, reason: str, retry_after: float, status_code: int = 429):
+        """
+        Initialize admission error.
+
+        Args:
+            reason: Why the trigger was rejected
+            retry_after: Seconds the caller should wait before retrying
+            status_code: HTTP status describing the rejection
+        """
+        super().__init__(reason)
+        self.retry_after = max(1, math.ceil(retry_after))
+        self.status_code = status_code
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at a fixed rate."""
+
+    def __init__(self, rate: float, capacity: float):
+        """
+        Initialize a full token bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of tokens (burst size)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def _refill(self) -> None:
+        """Add tokens accrued since the last update."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self) -> float:
+        """Return seconds until a token is available (0 if one is available now)."""
+        self._refill()
+        if self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    def consume(self) -> None:
+        """Take one token from the bucket."""
+        self.tokens -= 1
+
+    def refund(self) -> None:
+        """Return a token taken for a trigger that never ran."""
+        self.tokens = min(self.capacity, self.tokens + 1)
+
+    def is_full(self) -> bool:
+        """Check whether the bucket has fully refilled."""
+        self._refill()
+        return self.tokens >= self.capacity
+
+
+class AdmissionService:
+    """Admission control for manual task triggers."""
+
+    def __init__(
+        self,
+        task_service: TaskService,
+        client_rate: float,
+        client_burst: int,
+        task_rate: float,
+        task_burst: int,
+        max_in_flight: int,
+        stats_service: Optional[StatsService] = None
+    ):
+        """
+        Initialize admission service.
+
+        Args:
+            task_service: Service executing tasks and tracking in-flight runs
+            client_rate: Triggers per second allowed for each client
+            client_burst: Burst size for each client
+            task_rate: Triggers per second allowed for each task name
+            task_burst: Burst size for each task name
+            max_in_flight: Maximum number of runs (manual or scheduled) executing at once
+            stats_service: Source of recent run durations for retry hints
+
+        Raises:
+            ValueError: If a rate, burst or cap is not positive
+        """
+        if client_rate <= 0 or task_rate <= 0:
+            raise ValueError("Trigger rates must be greater than 0")
+        if client_burst < 1 or task_burst < 1:
+            raise ValueError("Trigger bursts must be at least 1")
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+
+        self.task_service = task_service
+        self.stats_service = stats_service
+        self.client_rate = client_rate
+        self.client_burst = client_burst
+        self.task_rate = task_rate
+        self.task_burst = task_burst
+        self.max_in_flight = max_in_flight
+
+        self._lock = threading.Lock()
+        self._client_buckets: Dict[str, TokenBucket] = {}
+        self._task_buckets: Dict[str, TokenBucket] = {}
+
+    def _get_bucket(self, buckets: Dict[str, TokenBucket], key: str, rate: float, burst: int) -> TokenBucket:
+        """Return the bucket for a key, creating it (and pruning idle ones) if needed."""
+        bucket = buckets.get(key)
+        if bucket is None:
+            if len(buckets) >= MAX_TRACKED_BUCKETS:
+                for idle_key in [k for k, b in buckets.items() if b.is_full()]:
+                    del buckets[idle_key]
+            bucket = TokenBucket(rate, burst)
+            buckets[key] = bucket
+        return bucket
+
+    def _typical_duration(self, task_name: Optional[str] = None) -> float:
+        """Return the recent p50 run duration of a task, else of all tasks, else a default."""
+        if self.stats_service is not None:
+            for name in (task_name, None):
+                p50 = self.stats_service.get_stats(name, "hour")["p50_duration"]
+                if p50 is not None:
+                    return p50
+        return DEFAULT_RETRY_AFTER
+
+    def _already_running(self, running_task: Task) -> AdmissionError:
+        """Build the rejection for a duplicate of an in-flight run."""
+        elapsed = (datetime.now() - running_task.start_time).total_seconds()
+        remaining = self._typical_duration(running_task.name) - elapsed
+        return AdmissionError(f"Task '{running_task.name}' is already running", remaining, status_code=409)
+
+    def _at_capacity(self) -> AdmissionError:
+        """Build the rejection for the in-flight cap."""
+        return AdmissionError(f"Too many tasks running ({self.max_in_flight} max)", self._typical_duration())
+
+    def admit(self, client_id: str, task_name: str) -> None:
+        """
+        Admit a manual trigger or reject it.
+
+        Rate limits are checked and charged first, so a client retrying
+        against a busy task or a full service still drains its bucket and
+        gets cheap 429s instead of repeated duplicate/capacity rejections.
+
+        Args:
+            client_id: Identifier of the calling client
+            task_name: Name of the task to run
+
+        Raises:
+            AdmissionError: If a rate limit is exceeded (429), the task is
+                already running (409), or the service is at capacity (429)
+        """
+        with self._lock:
+            client_bucket = self._get_bucket(self._client_buckets, client_id, self.client_rate, self.client_burst)
+            client_wait = client_bucket.wait_time()
+            if client_wait > 0:
+                raise AdmissionError("Client trigger rate limit exceeded", client_wait)
+
+            task_bucket = self._get_bucket(self._task_buckets, task_name, self.task_rate, self.task_burst)
+            task_wait = task_bucket.wait_time()
+            if task_wait > 0:
+                raise AdmissionError(f"Trigger rate limit exceeded for task '{task_name}'", task_wait)
+
+            client_bucket.consume()
+            task_bucket.consume()
+
+        running_task = self.task_service.running_task(task_name)
+        if running_task is not None:
+            raise self._already_running(running_task)
+
+        if self.task_service.in_flight_count() >= self.max_in_flight:
+            raise self._at_capacity()
+
+    def _refund(self, client_id: str, task_name: str) -> None:
+        """Return the tokens charged for a trigger rejected after admission."""
+        with self._lock:
+            for buckets, key in ((self._client_buckets, client_id), (self._task_buckets, task_name)):
+                bucket = buckets.get(key)
+                if bucket is not None:
+                    bucket.refund()
+
+    def run_task(self, client_id: str, task: Task) -> Task:
+        """
+        Admit a manual trigger and execute it.
+
+        The duplicate and capacity checks are repeated atomically when the run
+        is registered, so concurrent triggers cannot slip past admit().
+
+        Args:
+            client_id: Identifier of the calling client
+            task: Task model to execute
+
+        Returns:
+            Updated task model with execution results
+
+        Raises:
+            AdmissionError: If the trigger is rejected
+            ShuttingDownError: If the service is shutting down
+        """
+        self.admit(client_id, task.name)
+
+        try:
+            return self.task_service.execute_task(task, exclusive=True, max_in_flight=self.max_in_flight)
+        except TaskAlreadyRunningError as e:
+            self._refund(client_id, task.name)
+            raise self._already_running(e.running_task)
+        except AtCapacityError:
+            self._refund(client_id, task.name)
+            raise self._at_capacity()
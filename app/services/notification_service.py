@@ -22,7 +22,7 @@ class NotificationService:
         Args:
             message: Notification message
             success: Whether this is a success or failure notification
-            force: Force send ignoring daily limit
+            force: Force send ignoring daily limit (not counted towards it)
         """
         if not Config.SLACK_WEBHOOK_URL:
             logger.warning("SLACK_WEBHOOK_URL not set. Skipping Slack notification.")
@@ -51,8 +51,11 @@ class NotificationService:
             response = requests.post(Config.SLACK_WEBHOOK_URL, json=payload, timeout=10)
             response.raise_for_status()
 
-            count = self.db.increment_today_count()
-            logger.info(f"Slack notification sent ({count}/10 today): {message}")
+            if force:
+                logger.info(f"Slack notification sent (forced, not counted): {message}")
+            else:
+                count = self.db.increment_today_count()
+                logger.info(f"Slack notification sent ({count}/10 today): {message}")
 
         except requests.exceptions.RequestException as e:
             logger.error(f"Failed to send Slack notification: {e}")
@@ -1,12 +1,13 @@
 import random
 import pytz
 from datetime import datetime, timedelta
+from typing import Optional
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 from app.config.settings import Config
 from app.utils.logger import setup_logger
 from app.models.task import Task
-from app.services.task_service import TaskService
+from app.services.task_service import ShuttingDownError, TaskService
 from app.services.notification_service import NotificationService
 
 
@@ -28,13 +29,22 @@ class SchedulerService:
         self.notification_service = notification_service
         self.scheduler = BackgroundScheduler()
 
-    def _job_function(self) -> None:
-        """Execute scheduled task."""
+    def _job_function(self, task_name: str = "scheduled_task", recovered_run_id: Optional[int] = None) -> None:
+        """
+        Execute scheduled task.
+
+        Args:
+            task_name: Name of the task to execute
+            recovered_run_id: Journal id of the interrupted run being re-executed
+        """
         execution_time = datetime.now(pytz.utc)
         logger.info(f"Scheduled job triggered at: {execution_time}")
 
-        task = Task(name="scheduled_task")
-        self.task_service.execute_task(task)
+        task = Task(name=task_name)
+        try:
+            self.task_service.execute_task(task, recovered_run_id=recovered_run_id)
+        except ShuttingDownError as e:
+            logger.warning(f"Scheduled task '{task_name}' skipped: {e}")
 
     def _minute_notification_job(self) -> None:
         """Send periodic Slack notifications every minute."""
@@ -116,6 +126,19 @@ class SchedulerService:
                     name=f'Random Slack Notification {i}'
                 )
 
+    def _schedule_interrupted_runs(self) -> None:
+        """Re-execute task runs interrupted by a previous shutdown."""
+        for run_id, task_name in self.task_service.recover_interrupted_runs():
+            logger.info(f"Re-scheduling interrupted task '{task_name}'")
+            self.scheduler.add_job(
+                self._job_function,
+                'date',
+                run_date=datetime.now(),
+                args=[task_name, run_id],
+                id=f'recovered_job_{run_id}',
+                name=f'Recovered Job {run_id}'
+            )
+
     def start(self) -> None:
         """Start the scheduler with configured jobs."""
         if Config.CRON_SCHEDULE_MODE == "fixed":
@@ -124,6 +147,59 @@ class SchedulerService:
             self._setup_random_schedule()
 
         self._setup_slack_notifications()
+        self._schedule_interrupted_runs()
 
         self.scheduler.start()
         logger.info("Scheduler started successfully")
+
+    def begin_shutdown(self) -> None:
+        """Stop firing scheduled jobs and reject new task runs."""
+        if self.task_service.accepting:
+            logger.info("Shutdown requested: pausing scheduler and rejecting new task runs")
+        if self.scheduler.running:
+            self.scheduler.pause()
+        self.task_service.stop_accepting()
+
+    def shutdown(self, timeout: float) -> bool:
+        """
+        Stop the scheduler, draining in-flight task runs.
+
+        Running tasks get up to timeout seconds to finish and send their
+        notifications. If some are still going at the deadline the journal is
+        frozen and the caller must exit the process immediately: the pool
+        threads are not daemons and would otherwise keep it alive. Every
+        journaled run is then re-executed on next start.
+
+        The final notice is forced past the daily Slack limit so deploys are
+        always reported.
+
+        Args:
+            timeout: Seconds to wait for in-flight runs
+
+        Returns:
+            True if all runs finished, False if the process must exit now
+        """
+        logger.info(f"Shutting down scheduler (drain timeout: {timeout}s)")
+
+        self.begin_shutdown()
+        still_running = self.task_service.wait_for_in_flight(timeout)
+
+        if self.scheduler.running:
+            self.scheduler.shutdown(wait=False)
+
+        if not still_running:
+            logger.info("All in-flight tasks finished")
+            self.notification_service.send_slack("Service shutting down: all tasks finished", success=True, force=True)
+            logger.info("Scheduler shut down")
+            return True
+
+        names = ", ".join(self.task_service.abandon_in_flight())
+        logger.warning(f"Shutdown deadline reached with {len(still_running)} task(s) still running; "
+                       f"exiting, will re-run on next start: {names}")
+        self.notification_service.send_slack(
+            f"Service stopped at shutdown deadline: {len(still_running)} task(s) still running were cut off. "
+            f"Re-running on next start: {names}",
+            success=False,
+            force=True
+        )
+        return False
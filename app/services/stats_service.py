@@ -0,0 +1,167 @@
+import threading
+import time
+from typing import Dict, Optional, Tuple
+from app.utils.logger import setup_logger
+from app.models.run_stats import RunRollup, RunStatsDatabase
+from app.models.task import Task
+
+
+logger = setup_logger(__name__)
+
+# Bucket size in seconds and number of buckets kept per granularity
+GRANULARITIES = {
+    "minute": (60, 120),
+    "hour": (3600, 48),
+    "day": (86400, 32),
+}
+
+# Query window -> (granularity, number of completed buckets before the current one)
+WINDOWS = {
+    "minute": ("minute", 1),
+    "hour": ("minute", 60),
+    "day": ("hour", 24),
+    "week": ("day", 7),
+    "month": ("day", 30),
+}
+
+# Rollup key aggregating every task; URL path task names are never empty
+ALL_TASKS = ""
+
+
+class StatsService:
+    """Service maintaining incremental per-task run statistics rollups."""
+
+    def __init__(self, db: Optional[RunStatsDatabase] = None):
+        """
+        Initialize stats service and load persisted rollups.
+
+        Args:
+            db: Database for persisting rollup buckets
+        """
+        self.db = db or RunStatsDatabase()
+        self._lock = threading.Lock()
+        self._db_lock = threading.Lock()
+        self._buckets: Dict[str, Dict[Tuple[str, int], RunRollup]] = {g: {} for g in GRANULARITIES}
+        self._last_prune = 0
+        self._load()
+
+    def _load(self) -> None:
+        """Load rollups still within retention from the database."""
+        now = int(time.time())
+        for granularity, (size, keep) in GRANULARITIES.items():
+            since = self._bucket_start(now, size) - (keep - 1) * size
+            for rollup in self.db.load_rollups(granularity, since):
+                self._buckets[granularity][(rollup.task_name, rollup.bucket_start)] = rollup
+
+    @staticmethod
+    def _bucket_start(timestamp: float, size: int) -> int:
+        """Return the start of the bucket containing a timestamp."""
+        return int(timestamp // size * size)
+
+    def record(self, task: Task) -> None:
+        """
+        Fold a finished task run into the minute, hour and day rollups of
+        both the task and the all-tasks aggregate.
+
+        The in-memory update and row snapshot happen under the stats lock;
+        the SQLite writes happen after it is released so readers never wait
+        on disk. Writes are serialized in snapshot order by a separate lock.
+
+        Args:
+            task: Completed or failed task with start and end times
+        """
+        if task.duration is None or task.status not in ("completed", "failed"):
+            return
+
+        finished_at = task.end_time.timestamp()
+        succeeded = task.status == "completed"
+
+        with self._db_lock:
+            with self._lock:
+                rows = []
+                for granularity, (size, _) in GRANULARITIES.items():
+                    bucket_start = self._bucket_start(finished_at, size)
+                    for name in {task.name, ALL_TASKS}:
+                        key = (name, bucket_start)
+                        rollup = self._buckets[granularity].get(key)
+                        if rollup is None:
+                            rollup = RunRollup(task_name=name, granularity=granularity, bucket_start=bucket_start)
+                            self._buckets[granularity][key] = rollup
+                        rollup.add(succeeded, task.duration)
+                        rows.append(rollup.to_row())
+
+                cutoffs = self._prune(int(finished_at))
+
+            self.db.save_rollups(rows)
+            for granularity, cutoff in cutoffs.items():
+                self.db.delete_before(granularity, cutoff)
+
+    def _prune(self, now: int) -> Dict[str, int]:
+        """
+        Drop in-memory buckets that have fallen out of retention (at most once a minute).
+
+        Returns:
+            Cutoff bucket start per granularity to delete from the database
+        """
+        if now - self._last_prune < 60:
+            return {}
+        self._last_prune = now
+
+        cutoffs = {}
+        for granularity, (size, keep) in GRANULARITIES.items():
+            cutoff = self._bucket_start(now, size) - (keep - 1) * size
+            buckets = self._buckets[granularity]
+            for key in [k for k in buckets if k[1] < cutoff]:
+                del buckets[key]
+            cutoffs[granularity] = cutoff
+        return cutoffs
+
+    def get_stats(self, task_name: Optional[str] = None, window: str = "hour") -> dict:
+        """
+        Summarize runs over a trailing window.
+
+        The window covers its completed buckets plus the elapsed part of the
+        current one, and rates are scaled by that covered time.
+
+        Args:
+            task_name: Task to summarize, or None (or empty) for all tasks
+            window: One of minute, hour, day, week, month
+
+        Returns:
+            Run count, success rate, p50/p95 duration and runs per hour
+        """
+        if window not in WINDOWS:
+            raise ValueError(f"Unknown window '{window}'. Expected one of: {', '.join(WINDOWS)}")
+
+        task_name = task_name or None
+        granularity, num_buckets = WINDOWS[window]
+        size = GRANULARITIES[granularity][0]
+        now = time.time()
+        current = self._bucket_start(now, size)
+        starts = [current - i * size for i in range(num_buckets + 1)]
+        covered_hours = (now - starts[-1]) / 3600
+
+        name = task_name or ALL_TASKS
+        total = RunRollup(task_name=name, granularity=granularity, bucket_start=starts[-1])
+        with self._lock:
+            buckets = self._buckets[granularity]
+            for start in starts:
+                rollup = buckets.get((name, start))
+                if rollup is not None:
+                    total.merge(rollup)
+
+        p50 = total.sketch.quantile(0.5)
+        p95 = total.sketch.quantile(0.95)
+
+        return {
+            "task": task_name,
+            "window": window,
+            "runs": total.runs,
+            "successes": total.successes,
+            "failures": total.failures,
+            "success_rate": round(total.successes / total.runs, 4) if total.runs else None,
+            "avg_duration": round(total.total_duration / total.runs, 4) if total.runs else None,
+            "p50_duration": round(p50, 4) if p50 is not None else None,
+            "p95_duration": round(p95, 4) if p95 is not None else None,
+            "runs_per_hour": round(total.runs / covered_hours, 4)
+        }
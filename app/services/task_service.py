@@ -1,45 +1,118 @@
 import logging
 import os
 import random
+import threading
 import time
 from datetime import datetime
+from typing import List, Optional, Tuple
 from app.config.settings import Config
 from app.utils.logger import setup_logger
 from app.services.notification_service import NotificationService
+from app.services.stats_service import StatsService
 from app.models.task import Task
+from app.models.task_run import TaskRunDatabase
 
 
 logger = setup_logger(__name__)
 
 
+class ShuttingDownError(Exception):
+    """Raised when a task run is requested after shutdown has begun."""
+
+
+class TaskAlreadyRunningError(Exception):
+    """Raised when an exclusive run is requested for a task that is already running."""
+
+    def __init__(self, running_task: Task):
+        """
+        Initialize error.
+
+        Args:
+            running_task: The run currently in flight
+        """
+        super().__init__(f"Task '{running_task.name}' is already running")
+        self.running_task = running_task
+
+
+class AtCapacityError(Exception):
+    """Raised when a run would exceed the allowed number of in-flight runs."""
+
+
 class TaskService:
     """Service layer for task execution with extensive logging."""
 
-    def __init__(self, notification_service: NotificationService):
+    def __init__(self, notification_service: NotificationService, stats_service: Optional[StatsService] = None):
         """
         Initialize task service.
 
         Args:
             notification_service: Service for sending notifications
+            stats_service: Service collecting run statistics rollups
         """
         self.notification_service = notification_service
-
-    def execute_task(self, task: Task) -> Task:
+        self.stats_service = stats_service
+        self.run_db = TaskRunDatabase()
+        self.accepting = True
+        self._journal_frozen = False
+        self._in_flight = {}
+        self._in_flight_changed = threading.Condition()
+
+    def execute_task(
+        self,
+        task: Task,
+        recovered_run_id: Optional[int] = None,
+        exclusive: bool = False,
+        max_in_flight: Optional[int] = None
+    ) -> Task:
         """
         Execute a task with extensive logging.
 
         Args:
             task: Task model to execute
+            recovered_run_id: Journal id of an interrupted run this execution replaces
+            exclusive: Refuse to start if a task with the same name is running
+            max_in_flight: Refuse to start if this many runs are already in flight
 
         Returns:
             Updated task model with execution results
+
+        Raises:
+            ShuttingDownError: If the service is shutting down
+            TaskAlreadyRunningError: If exclusive and the task is already running
+            AtCapacityError: If max_in_flight runs are already in flight
         """
-        task.start_time = datetime.now()
-        task.status = "running"
+        with self._in_flight_changed:
+            if not self.accepting:
+                raise ShuttingDownError("Task service is shutting down")
+
+            if exclusive:
+                running_task = self._find_running(task.name)
+                if running_task is not None:
+                    raise TaskAlreadyRunningError(running_task)
 
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        task.log_file_path = os.path.join(Config.LOG_DIR, f"{task.name}_{timestamp}.log")
+            if max_in_flight is not None and len(self._in_flight) >= max_in_flight:
+                raise AtCapacityError(f"Too many tasks running ({max_in_flight} max)")
 
+            task.start_time = datetime.now()
+            task.status = "running"
+
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            task.log_file_path = os.path.join(Config.LOG_DIR, f"{task.name}_{timestamp}.log")
+
+            run_id = self.run_db.add_run(task)
+            self._in_flight[run_id] = task
+
+        try:
+            if recovered_run_id is not None:
+                self.run_db.remove_run(recovered_run_id)
+            self._run_task(task)
+        finally:
+            self._finish_run(run_id)
+
+        return task
+
+    def _run_task(self, task: Task) -> None:
+        """Run a registered task, logging and reporting its outcome."""
         task_logger = self._setup_task_logger(task.name, task.log_file_path)
 
         try:
@@ -68,8 +141,108 @@ class TaskService:
 
         finally:
             self._cleanup_logger(task_logger)
+            self._record_stats(task)
 
-        return task
+    def in_flight_count(self) -> int:
+        """Return the number of task runs currently in flight."""
+        with self._in_flight_changed:
+            return len(self._in_flight)
+
+    def running_task(self, task_name: str) -> Optional[Task]:
+        """
+        Get the in-flight run of a task, if any.
+
+        Args:
+            task_name: Name of the task
+
+        Returns:
+            The running task, or None if it is not running
+        """
+        with self._in_flight_changed:
+            return self._find_running(task_name)
+
+    def _find_running(self, task_name: str) -> Optional[Task]:
+        """Find an in-flight run by task name (caller holds the lock)."""
+        for task in self._in_flight.values():
+            if task.name == task_name:
+                return task
+        return None
+
+    def stop_accepting(self) -> None:
+        """Reject any further task runs."""
+        with self._in_flight_changed:
+            self.accepting = False
+
+    def abandon_in_flight(self) -> List[str]:
+        """
+        Freeze the run journal ahead of a forced exit.
+
+        Runs finishing after this call keep their journal entries, so every
+        journaled run is re-executed on next start even if it completes
+        before the process dies.
+
+        Returns:
+            Names of the journaled tasks that will be re-executed
+        """
+        with self._in_flight_changed:
+            self._journal_frozen = True
+            return [task.name for _, task in self.run_db.get_runs()]
+
+    def wait_for_in_flight(self, timeout: float) -> List[Task]:
+        """
+        Wait for in-flight task runs to finish.
+
+        Args:
+            timeout: Maximum number of seconds to wait
+
+        Returns:
+            Tasks still running when the deadline passed
+        """
+        deadline = time.monotonic() + timeout
+        with self._in_flight_changed:
+            while self._in_flight:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                logger.info(f"Waiting for {len(self._in_flight)} in-flight task(s) to finish")
+                self._in_flight_changed.wait(remaining)
+            return list(self._in_flight.values())
+
+    def recover_interrupted_runs(self) -> List[Tuple[int, str]]:
+        """
+        Close out runs left unfinished by a previous process.
+
+        Each interrupted run gets a closing entry in its log file. Its journal
+        entry is kept until the re-execution starts, so the work survives
+        another restart in between.
+
+        Returns:
+            (run_id, task_name) tuples of the interrupted runs
+        """
+        interrupted = []
+        for run_id, task in self.run_db.get_runs():
+            logger.warning(f"Found interrupted run of task '{task.name}' started at {task.start_time}")
+
+            if task.log_file_path and os.path.exists(task.log_file_path):
+                with open(task.log_file_path, "a") as f:
+                    f.write(f"[{datetime.now()}] WARNING - TASK INTERRUPTED: process stopped before completion, "
+                            f"task will be re-executed\n")
+
+            interrupted.append((run_id, task.name))
+
+        return interrupted
+
+    def _finish_run(self, run_id: int) -> None:
+        """Remove a finished run from the journal and the in-flight set."""
+        with self._in_flight_changed:
+            if not self._journal_frozen:
+                try:
+                    self.run_db.remove_run(run_id)
+                except Exception as e:
+                    logger.error(f"Failed to remove run {run_id} from journal: {e}")
+
+            self._in_flight.pop(run_id, None)
+            self._in_flight_changed.notify_all()
 
     def _setup_task_logger(self, task_name: str, log_file_path: str) -> logging.Logger:
         """Setup task-specific logger."""
@@ -135,6 +308,16 @@ class TaskService:
 
         logger.error(f"Task '{task.name}' failed: {error} | Duration: {task.duration:.2f}s | Log: {task.log_file_path}")
 
+    def _record_stats(self, task: Task) -> None:
+        """Feed the finished task into the run statistics rollups."""
+        if self.stats_service is None:
+            return
+
+        try:
+            self.stats_service.record(task)
+        except Exception as e:
+            logger.error(f"Failed to record stats for task '{task.name}': {e}")
+
     def _cleanup_logger(self, task_logger: logging.Logger) -> None:
         """Clean up task logger handlers."""
         for handler in task_logger.handlers[:]:
@@ -0,0 +1,124 @@
+import json
+import math
+from typing import Dict, Optional
+
+
+class QuantileSketch:
+    """
+    Mergeable streaming quantile sketch with bounded relative error.
+
+    Values are counted in logarithmically sized bins, so memory depends on the
+    spread of the values rather than on how many were added.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01, max_bins: int = 512):
+        """
+        Initialize an empty sketch.
+
+        Args:
+            relative_accuracy: Maximum relative error of returned quantiles
+            max_bins: Upper bound on stored bins (lowest bins are collapsed)
+        """
+        self.relative_accuracy = relative_accuracy
+        self.max_bins = max_bins
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self.bins: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+
+    def _index(self, value: float) -> int:
+        """Return the bin index for a positive value."""
+        return int(math.ceil(math.log(value) / self._log_gamma))
+
+    def _value(self, index: int) -> float:
+        """Return the representative value of a bin."""
+        return 2 * self._gamma ** index / (self._gamma + 1)
+
+    def add(self, value: float, count: int = 1) -> None:
+        """
+        Add a non-negative value to the sketch.
+
+        Args:
+            value: Observed value (e.g. a duration in seconds)
+            count: Number of times the value was observed
+        """
+        if value <= 0:
+            self.zero_count += count
+        else:
+            index = self._index(value)
+            self.bins[index] = self.bins.get(index, 0) + count
+            self._collapse()
+        self.count += count
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """
+        Merge another sketch with the same accuracy into this one.
+
+        Args:
+            other: Sketch to merge
+        """
+        for index, count in other.bins.items():
+            self.bins[index] = self.bins.get(index, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self._collapse()
+
+    def _collapse(self) -> None:
+        """Fold the lowest bins together once max_bins is exceeded."""
+        if len(self.bins) <= self.max_bins:
+            return
+        indexes = sorted(self.bins)
+        overflow = indexes[:len(indexes) - self.max_bins + 1]
+        target = overflow[-1]
+        self.bins[target] = sum(self.bins.pop(i) for i in overflow)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate the value at quantile q.
+
+        Args:
+            q: Quantile between 0 and 1
+
+        Returns:
+            Estimated value, or None if the sketch is empty
+        """
+        if self.count == 0:
+            return None
+
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return 0.0
+
+        for index in sorted(self.bins):
+            seen += self.bins[index]
+            if rank < seen:
+                return self._value(index)
+
+        return self._value(max(self.bins))
+
+    def to_json(self) -> str:
+        """Serialize the sketch to a compact JSON string."""
+        return json.dumps(
+            {"a": self.relative_accuracy, "z": self.zero_count, "b": self.bins},
+            separators=(",", ":")
+        )
+
+    @classmethod
+    def from_json(cls, data: str) -> "QuantileSketch":
+        """
+        Restore a sketch serialized with to_json.
+
+        Args:
+            data: JSON string produced by to_json
+
+        Returns:
+            Restored sketch
+        """
+        raw = json.loads(data)
+        sketch = cls(relative_accuracy=raw["a"])
+        sketch.zero_count = raw["z"]
+        sketch.bins = {int(index): count for index, count in raw["b"].items()}
+        sketch.count = sketch.zero_count + sum(sketch.bins.values())
+        return sketch
@@ -1,14 +1,19 @@
-from fastapi import FastAPI
+import os
+import signal
+from fastapi import FastAPI, Request
 from fastapi.responses import PlainTextResponse
-from typing import List
+from typing import List, Optional
 
 from app.config.settings import Config
 from app.utils.logger import setup_logger
+from app.services.admission_service import AdmissionService
 from app.services.notification_service import NotificationService
+from app.services.stats_service import StatsService
 from app.services.task_service import TaskService
 from app.services.scheduler_service import SchedulerService
 from app.controllers.task_controller import TaskController
 from app.controllers.log_controller import LogController
+from app.controllers.stats_controller import StatsController
 
 
 Config.ensure_directories()
@@ -18,15 +23,55 @@ logger.info(f"Application started. LOG_DIR: {Config.LOG_DIR}")
 app = FastAPI(title="Cron Job API", version="1.0.0")
 
 notification_service = NotificationService()
-task_service = TaskService(notification_service)
+stats_service = StatsService()
+task_service = TaskService(notification_service, stats_service)
 scheduler_service = SchedulerService(task_service, notification_service)
 
-task_controller = TaskController(task_service)
+admission_service = AdmissionService(
+    task_service,
+    client_rate=Config.CLIENT_TRIGGERS_PER_MINUTE / 60,
+    client_burst=Config.CLIENT_TRIGGER_BURST,
+    task_rate=Config.TASK_TRIGGERS_PER_MINUTE / 60,
+    task_burst=Config.TASK_TRIGGER_BURST,
+    max_in_flight=Config.MAX_IN_FLIGHT_RUNS,
+    stats_service=stats_service
+)
+
+task_controller = TaskController(task_service, admission_service)
 log_controller = LogController()
+stats_controller = StatsController(stats_service)
 
 scheduler_service.start()
 
 
+@app.on_event("startup")
+def install_shutdown_signal_handlers():
+    """
+    Stop taking new work as soon as SIGINT/SIGTERM arrives.
+
+    uvicorn drains open HTTP requests before running shutdown hooks, so the
+    scheduler is paused here instead. uvicorn's own handler still runs: it is
+    dispatched by the event loop and is chained below for the non-loop case.
+    """
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        previous = signal.getsignal(sig)
+
+        def handler(signum, frame, previous=previous):
+            scheduler_service.begin_shutdown()
+            if callable(previous):
+                previous(signum, frame)
+
+        signal.signal(sig, handler)
+
+
+@app.on_event("shutdown")
+def shutdown_event():
+    """Drain in-flight tasks before the process exits."""
+    if not scheduler_service.shutdown(timeout=Config.SHUTDOWN_TIMEOUT):
+        # Task threads are not daemons; exit now so the deadline holds
+        os._exit(1)
+
+
 @app.get("/", response_class=PlainTextResponse)
 async def root():
     """Root endpoint with API information."""
@@ -34,17 +79,21 @@ async def root():
 
 
 @app.post("/run_task/{task_name}")
-async def run_task_manually(task_name: str):
+def run_task_manually(task_name: str, request: Request):
     """
     Trigger a task run manually.
 
+    Runs in the worker thread pool so a long task does not block the event
+    loop; admission control bounds how many run at once.
+
     Args:
         task_name: Name of the task to execute
 
     Returns:
         Task execution details including log file path
     """
-    return task_controller.run_task(task_name)
+    client_id = request.client.host if request.client else "unknown"
+    return task_controller.run_task(task_name, client_id)
 
 
 @app.get("/logs", response_model=List[str])
@@ -72,6 +121,21 @@ async def get_log_content(log_file_name: str):
     return log_controller.get_log_content(log_file_name)
 
 
+@app.get("/stats")
+async def get_stats(task: Optional[str] = None, window: str = "hour"):
+    """
+    Get run statistics over a trailing window.
+
+    Args:
+        task: Task name to summarize (all tasks if omitted)
+        window: One of minute, hour, day, week, month
+
+    Returns:
+        Run count, success rate, p50/p95 duration and runs per hour
+    """
+    return stats_controller.get_stats(task, window)
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)